@@ -55,7 +55,8 @@ class MCoordinates(gm.Coordinates2D):
     @classmethod
     def from_chunk(cls, cx: types.ScalarLike,
                    cz: types.ScalarLike,
-                   center: bool = False) -> types.Self:
+                   center: bool = False,
+                   dtype: types.DTypeLike = None) -> types.Self:
         """Constructs the Coordinates from chunk numbers.
 
         Args:
@@ -64,10 +65,11 @@ class MCoordinates(gm.Coordinates2D):
             center (bool, optional): Whether to return coordinates at the (8, 8)
             coordinates of the chunk (True) or at (0, 0) in the chunk (False).
             Defaults to False.
+            dtype (DTypeLike, optional): The complex dtype to use. Defaults to None (see `Coordinates2D`).
         """
 
         n = 8 if center else 0
-        return cls.from_rect(16*cx + n, 16*cz + n)
+        return cls.from_rect(16*cx + n, 16*cz + n, dtype)
 
     @property
     def yrot(self) -> types.ScalarLike:
@@ -83,18 +85,18 @@ class MCoordinates(gm.Coordinates2D):
     @property
     def chunk_corner(self) -> types.Self:
         x, z = self.x // 16, self.z // 16
-        return self.__class__.from_rect(16 * x, 16 * z)
+        return self.__class__.from_rect(16 * x, 16 * z, self.dtype)
 
     @property
     def chunk_center(self) -> types.Self:
-        return self.__class__(self.chunk_corner + (8.0 + 8.0j))
+        return self.__class__(self.chunk_corner + (8.0 + 8.0j), self.dtype)
 
     @property
     def chunk_coords(self) -> types.Self:
-        return self.__class__.from_rect(self.x // 16, self.z // 16)
+        return self.__class__.from_rect(self.x // 16, self.z // 16, self.dtype)
 
     def in_nether(self, chunk: bool = False) -> types.Self:
-        nether_coords = self.__class__.from_rect(self.x // 8, self.z // 8)
+        nether_coords = self.__class__.from_rect(self.x // 8, self.z // 8, self.dtype)
         if chunk:
             return nether_coords.chunk_coords
         return nether_coords
@@ -6,7 +6,8 @@ __all__ = ["closest_stronghold", "EyeThrow"]
 
 
 def closest_stronghold(p: cm.MCoordinates,
-                       s: cm.MCoordinates
+                       s: cm.MCoordinates,
+                       dtype: types.DTypeLike = None
                        ) -> cm.MCoordinates:
     """
     Finds the closest stronghold from coordinates `s` to the player `p`.
@@ -17,21 +18,28 @@ def closest_stronghold(p: cm.MCoordinates,
       coordinate arrays each representing a different world, it will
       do this for each world.
     - In general, the output shape is p.shape + s.shape[:-1].
+
+    If `dtype` is given, both `p` and `s` are cast to it first, so
+    `dtype=np.complex64` does the whole search in single precision.
+    Otherwise the usual NumPy type promotion applies.
     """
 
+    if dtype is not None:
+        p, s = cm.MCoordinates(p, dtype), cm.MCoordinates(s, dtype)
+
     # adds empty axes to so that we can do broadcasting for |s - p|
     N = (None for _ in range(s.ndim))
     P = p[..., *N]
 
-    # finds the mins along the last axis
-    m = (s - P).r.min(axis=-1, keepdims=True)
+    # finds the indices of the mins along the last axis
+    i = (s - P).r.argmin(axis=-1, keepdims=True)
 
-    # tiles s to have the same shape as m
+    # tiles s to have the same shape as |s - p|
     S = gm.np.tile(s, (*p.shape, *gm.np.ones_like(s.shape)))
 
-    # identifies the strongholds in s that minimize |s - p|
-    M = gm.np.where((S - P).r == m, S, 0)
-    return cm.MCoordinates(M.sum(axis=-1))
+    # picks exactly one stronghold in s that minimizes |s - p|, even on ties
+    M = gm.np.take_along_axis(S, i, axis=-1)
+    return cm.MCoordinates(M[..., 0], M.dtype)
 
 
 @dataclass
@@ -43,6 +51,8 @@ class EyeThrow:
     error: types.Scalar
 
     def __post_init__(self) -> None:
+        self.location = cm.MCoordinates(self.location)
+
         # convert throw angle to radians
         self.theta: types.Scalar = cm.to_phi(self.angle)
         self.dtheta: types.Scalar = self.error * gm.np.pi/180
@@ -52,9 +62,10 @@ class EyeThrow:
         self.theta_b: types.Scalar = self.theta + self.dtheta
 
         # stores unit vectors for "throw cone"
-        self.ray_0 = cm.MCoordinates.from_polar(1, self.theta)
-        self.ray_a = cm.MCoordinates.from_polar(1, self.theta_a)
-        self.ray_b = cm.MCoordinates.from_polar(1, self.theta_b)
+        dtype = self.location.dtype
+        self.ray_0 = cm.MCoordinates.from_polar(1, self.theta, dtype=dtype)
+        self.ray_a = cm.MCoordinates.from_polar(1, self.theta_a, dtype=dtype)
+        self.ray_b = cm.MCoordinates.from_polar(1, self.theta_b, dtype=dtype)
 
     def points_in_cone(self, grid: cm.MCoordinates, z_score: float = 3) -> cm.MCoordinates:
         """Finds the possible grid locations the throw could be pointing towards."""
@@ -47,43 +47,59 @@ def normal(y: types.ScalarLike, mean: types.ScalarLike,
 class Coordinates2D(np.ndarray):
     """Stores 2D points in complex form."""
 
-    def __new__(cls, coords: types.Self | types.PointLike) -> types.Self:
+    def __new__(cls, coords: types.Self | types.PointLike,
+                dtype: types.DTypeLike = None) -> types.Self:
         """Constructs the Coordinates from complex data.
 
         Args:
             coords (Self | PointLike): The coordinates in complex form.
+            dtype (DTypeLike, optional): The complex dtype to store the coordinates in.
+            Defaults to None (complex64 if `coords` is already complex64, else complex128).
+
+        Raises:
+            ValueError: If `dtype` is not a complex dtype.
         """
 
-        obj = np.asarray(coords, dtype=np.complex128).view(cls)
+        coords = np.asarray(coords)
+        if dtype is None:
+            dtype = coords.dtype if coords.dtype == np.complex64 else np.complex128
+        if not np.issubdtype(dtype, np.complexfloating):
+            raise ValueError(f"dtype must be complex, not {np.dtype(dtype)}")
+
+        obj = np.asarray(coords, dtype=dtype).view(cls)
         return obj
 
     def __repr__(self) -> str:
         return self.to_xz().__repr__()
 
     @classmethod
-    def from_rect(cls, x: types.ScalarLike, z: types.ScalarLike) -> types.Self:
+    def from_rect(cls, x: types.ScalarLike, z: types.ScalarLike,
+                  dtype: types.DTypeLike = None) -> types.Self:
         """Constructs the Coordinates from [x, z] data.
 
         Args:
             x (ScalarLike): The x coordinates.
             z (ScalarLike): The z coordinates.
+            dtype (DTypeLike, optional): The complex dtype to use. Defaults to None (see `Coordinates2D`).
         """
 
-        return cls(x + 1j * z)
+        return cls(x + 1j * z, dtype)
 
     @classmethod
     def from_polar(cls, r: types.ScalarLike,
                    phi: types.ScalarLike,
-                   deg: bool = False) -> types.Self:
+                   deg: bool = False,
+                   dtype: types.DTypeLike = None) -> types.Self:
         """Constructs the Coordinates from the radius and x/z angle.
 
         Args:
             r (ScalarLike): The distance from the origin.
             phi (ScalarLike): The polar angle between the x and z axes.
             deg (bool, optional): Whether to consider phi in degrees. Defaults to False.
+            dtype (DTypeLike, optional): The complex dtype to use. Defaults to None (see `Coordinates2D`).
         """
 
-        return cls(r * phasor(phi, deg=deg))
+        return cls(r * phasor(phi, deg=deg), dtype)
 
     @property
     def coords(self) -> types.PointLike:
@@ -96,7 +112,7 @@ class Coordinates2D(np.ndarray):
         coords = self.__array__()
         if not coords.shape:
             coords = coords.item()
-        return np.complex128(coords)
+        return self.dtype.type(coords)
 
     @property
     def x(self) -> types.ScalarLike:
@@ -129,9 +145,10 @@ class Coordinates2D(np.ndarray):
         """
 
         if origin is None:
-            origin = self.__class__(0)
+            origin = self.__class__(0, self.dtype)
 
-        return origin + phasor(delta, deg=deg) * (self - origin)
+        w = np.asarray(phasor(delta, deg=deg), dtype=self.dtype)
+        return origin + w * (self - origin)
 
     def relative_angle(self, other, direction: types.Self | None = None) -> types.ScalarLike:
         rel = self - other
@@ -66,15 +66,17 @@ class Predict:
 
     def __init__(self, grid: cm.MCoordinates | None = None,
                  heatmap: cm.MCoordinates | None = None,
-                 rng: types.Generator = gen.default_rng) -> None:
-
-        if grid is None:
-            grid = gen.generation_grid()
-        self.grid = grid
+                 rng: types.Generator = gen.default_rng,
+                 dtype: types.DTypeLike = None) -> None:
 
+        # the heatmap sets the dtype unless one is given
         if heatmap is None:
-            heatmap = gen.generation_heatmap(10**6, rng=rng, concatenate=False)
-        self.heatmap = heatmap
+            heatmap = gen.generation_heatmap(10**6, rng=rng, concatenate=False, dtype=dtype)
+        self.heatmap = cm.MCoordinates(heatmap, dtype)
+
+        if grid is None:
+            grid = gen.generation_grid(dtype=self.heatmap.dtype)
+        self.grid = cm.MCoordinates(grid, self.heatmap.dtype)
 
         self.throws: list[loc.EyeThrow] = []
         self.individual_probs: list[Probabilities] = []
@@ -86,7 +88,7 @@ class Predict:
         """Creates an interpolator for the nearest strongholds to a point."""
 
         # bin the coordinates
-        closest_strongholds = loc.closest_stronghold(player, self.heatmap)
+        closest_strongholds = loc.closest_stronghold(player, self.heatmap, self.heatmap.dtype)
         H, x_edges, z_edges = np.histogram2d(closest_strongholds.x,
                                              closest_strongholds.z,
                                              bins=bins, density=False)
@@ -127,7 +129,7 @@ class Predict:
         Adds an Eye of Ender throw to the list of throws and computes the resulting probabilities.
         """
 
-        player = cm.MCoordinates(player)
+        player = cm.MCoordinates(player, self.grid.dtype)
 
         # saves the throw data
         throw = loc.EyeThrow(player, angle, angle_error)
@@ -2,15 +2,17 @@ from typing import Callable, Iterable, Self
 
 import numpy as np
 import nptyping as npt
+from numpy.typing import DTypeLike
 
-__all__ = ["Callable", "Iterable", "Self", "Generator", "Scalar", "NSequence", "ScalarLike", "Point", "Points"]
+__all__ = ["Callable", "Iterable", "Self", "Generator", "Scalar", "NSequence", "ScalarLike", "Point", "Points",
+           "DTypeLike"]
 
 Generator = np.random.Generator
 
-Scalar = int | float | npt.Int32 | npt.Float64
-NSequence = npt.NDArray[npt.Shape["* n"], npt.Float64]
+Scalar = int | float | npt.Int32 | npt.Float32 | npt.Float64
+NSequence = npt.NDArray[npt.Shape["* n"], npt.Floating]
 ScalarLike = Scalar | NSequence
 
-Point = complex | npt.Complex128
-Points = npt.NDArray[npt.Shape["*"], npt.Complex128]
+Point = complex | npt.Complex64 | npt.Complex128
+Points = npt.NDArray[npt.Shape["*"], npt.ComplexFloating]
 PointLike = Point | Points
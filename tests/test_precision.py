@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from strongholds import chunk_math as cm, generate as gen, locate as loc
+from strongholds.predict import Predict
+
+# Stronghold coordinates fit within +/-25,000 blocks, where float32 resolves about
+# 2e-3 blocks. Snapped strongholds are stored exactly, but a raw position can round
+# across a chunk edge before snapping, moving it by one chunk. This happens to
+# fewer than 1 in 10**4 strongholds (7.0e-5 for this seed) and shifts the
+# probabilities by less than 1e-6 (7.0e-7 for this seed and throw).
+CHUNK_FLIP_RATE = 1e-4
+TOLERANCE = 1e-6
+
+THROW_LOCATION = 123.456 + 234.567j
+THROW_ANGLE = 30.25
+
+
+def heatmap(dtype: np.dtype, seed: int = 0, num_samples: int = 2000) -> cm.MCoordinates:
+    rng = np.random.default_rng(seed)
+    return gen.generation_heatmap(num_samples, rng=rng, concatenate=False, dtype=dtype)
+
+
+@pytest.fixture(scope="module")
+def heatmaps() -> dict[type, cm.MCoordinates]:
+    return {dtype: heatmap(dtype) for dtype in (np.complex64, np.complex128)}
+
+
+@pytest.fixture(scope="module")
+def grid() -> cm.MCoordinates:
+    return gen.generation_grid(ring_nums=[0])
+
+
+def test_heatmap_dtype(heatmaps):
+    h32, h64 = heatmaps[np.complex64], heatmaps[np.complex128]
+
+    assert h32.dtype == np.complex64
+    assert h64.dtype == np.complex128
+    assert 2 * h32.nbytes == h64.nbytes
+
+    moved = h32 != h64
+    assert moved.mean() < CHUNK_FLIP_RATE
+    assert np.abs(h32 - h64).max() <= 16 * np.sqrt(2)
+
+
+def test_probabilities_match(heatmaps, grid):
+    probs = {}
+    for dtype, h in heatmaps.items():
+        # the dtype is inferred from the heatmap
+        predict = Predict(grid=grid, heatmap=h)
+        predict.add_throw(THROW_LOCATION, THROW_ANGLE)
+        probs[dtype] = predict.cumulative_probs
+
+        throw = predict.throws[0]
+        assert predict.heatmap.dtype == dtype
+        assert predict.grid.dtype == dtype
+        assert throw.location.dtype == dtype
+        assert throw.ray_0.dtype == dtype
+        assert probs[dtype].points.dtype == dtype
+
+    p32, p64 = probs[np.complex64], probs[np.complex128]
+    assert p32.keys() == p64.keys()
+
+    max_diff = max(abs(p32[k] - p64[k]) for k in p64)
+    assert max_diff < TOLERANCE
+
+
+def test_closest_stronghold_ties():
+    s = cm.MCoordinates([100, -100, 300j])
+    closest = loc.closest_stronghold(cm.MCoordinates(0), s)
+
+    assert closest == 100
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.int64])
+def test_coordinates_rejects_real_dtype(dtype):
+    with pytest.raises(ValueError):
+        cm.MCoordinates([1 + 2j], dtype)
+
+
+def test_coordinates_casts_object_data():
+    coords = cm.MCoordinates(np.array([1, None], dtype=object))
+
+    assert coords.dtype == np.complex128
+
+
+def test_coordinates_keeps_complex64():
+    points = [cm.MCoordinates(1 + 2j, np.complex64), np.complex64(3 + 4j)]
+
+    assert cm.MCoordinates(points).dtype == np.complex64
+    assert cm.MCoordinates(points).rotated(0.5).dtype == np.complex64
+
+
+@pytest.mark.parametrize("coords", [
+    cm.MCoordinates(1234.567 + 7654.321j),
+    cm.MCoordinates(0),
+    cm.MCoordinates(np.array([1, 2], dtype=np.int16)),
+    cm.MCoordinates.from_rect(1234.567, 7654.321),
+    cm.MCoordinates.from_polar(12345.678, 0.3),
+    cm.MCoordinates.from_chunk(3, 5),
+])
+def test_coordinates_default_complex128(coords):
+    assert coords.dtype == np.complex128